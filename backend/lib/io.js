@@ -2,9 +2,13 @@ const fs = require('fs');
 
 const loadFile = (path) => {
     path = path.replace(process.env.dataPath, '').replace(/^[.\/]+/, '').replace(/\.json$/, '') + '.json';
-    const fileExists = fs.existsSync(`${process.env.dataPath}/${path}`);    
-    if(!fileExists) return false;
-    const fileData = fs.readFileSync(`${process.env.dataPath}/${path}`, 'utf8');
+    let fileData;
+    try{
+        fileData = fs.readFileSync(`${process.env.dataPath}/${path}`, 'utf8');
+    }catch(e){
+        if(e.code === 'ENOENT') return false;
+        throw e;
+    }
     try{
         return JSON.parse(fileData);
     }catch(e){